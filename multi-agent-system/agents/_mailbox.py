@@ -0,0 +1,72 @@
+import asyncio
+from collections import deque
+from typing import Any, List, Optional
+
+class Mailbox:
+    """Lightweight agent mailbox with the asyncio.Queue put/get interface.
+
+    Messages are buffered in a deque. When the consuming agent is already
+    waiting, put() resolves its future directly instead of going through
+    the buffer, so delivery costs a single set_result.
+    """
+
+    def __init__(self):
+        self._messages: deque = deque()
+        self._getter: Optional[asyncio.Future] = None
+
+    def qsize(self) -> int:
+        return len(self._messages)
+
+    def empty(self) -> bool:
+        return not self._messages
+
+    def put_nowait(self, message: Any):
+        """Deliver a message, handing it straight to a waiting getter if any."""
+        getter = self._getter
+        if getter is not None and not getter.done():
+            self._getter = None
+            getter.set_result(message)
+        else:
+            self._messages.append(message)
+
+    def put_many(self, messages: List[Any]):
+        """Deliver a batch of messages, waking the waiting getter at most once."""
+        if not messages:
+            return
+        getter = self._getter
+        if getter is not None and not getter.done():
+            self._getter = None
+            getter.set_result(messages[0])
+            self._messages.extend(messages[1:])
+        else:
+            self._messages.extend(messages)
+
+    async def put(self, message: Any):
+        """Deliver a message. Never blocks; async for asyncio.Queue compatibility."""
+        self.put_nowait(message)
+
+    def get_nowait(self) -> Any:
+        """Return the next buffered message or raise asyncio.QueueEmpty."""
+        if not self._messages:
+            raise asyncio.QueueEmpty
+        return self._messages.popleft()
+
+    async def get(self) -> Any:
+        """Return the next message, waiting for one if the mailbox is empty."""
+        if self._messages:
+            return self._messages.popleft()
+        if self._getter is not None and not self._getter.done():
+            raise RuntimeError('Mailbox supports a single waiting consumer')
+        getter = asyncio.get_running_loop().create_future()
+        self._getter = getter
+        try:
+            return await getter
+        except asyncio.CancelledError:
+            # A message handed over just before the cancellation goes back to
+            # the front of the mailbox instead of being lost
+            if getter.done() and not getter.cancelled():
+                self._messages.appendleft(getter.result())
+            raise
+        finally:
+            if self._getter is getter:
+                self._getter = None
@@ -1,28 +1,40 @@
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import ClassVar, Dict, FrozenSet, List, Optional, Any
 from integrations.service_connector import CrewAIConnector, TaskadeConnector, AbacusConnector
+from utils.template_manager import TemplateManager
+from agents._mailbox import Mailbox
 from abc import ABC, abstractmethod
-import json
 import logging
 from datetime import datetime
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+async def _no_result() -> None:
+    """Stand-in for a call to a service connector that is not configured."""
+    return None
 
 class Agent(ABC):
     """Base class for all agents in the system."""
+
+    __slots__ = (
+        'agent_id', 'capabilities', 'message_queue', 'busy',
+        'crewai_connector', 'taskade_connector', 'abacus_connector',
+        '_loop'
+    )
     
     def __init__(self, agent_id: str, capabilities: List[str]):
         """Initialize agent with optional service connectors."""
         self.agent_id = agent_id
         self.capabilities = capabilities
-        self.message_queue = asyncio.Queue()
+        self.message_queue = Mailbox()
         self.busy = False
         # Service connectors will be set by the environment
         self.crewai_connector: Optional[CrewAIConnector] = None
         self.taskade_connector: Optional[TaskadeConnector] = None
         self.abacus_connector: Optional[AbacusConnector] = None
-        logger.info(f"Agent {agent_id} initialized with capabilities: {capabilities}")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        logger.info("Agent %s initialized with capabilities: %s", agent_id, capabilities)
 
     async def send_message(self, target_agent: 'Agent', message: Dict[str, Any]):
         """Send a message to another agent."""
@@ -30,18 +42,50 @@ class Agent(ABC):
             'from': self.agent_id,
             'content': message
         })
-        logger.info(f"Agent {self.agent_id} sent message to {target_agent.agent_id}")
+        logger.info("Agent %s sent message to %s", self.agent_id, target_agent.agent_id)
+
+    async def send_messages(self, target_agent: 'Agent', messages: List[Dict[str, Any]]):
+        """Send several messages to another agent with a single mailbox operation."""
+        target_agent.message_queue.put_many([
+            {'from': self.agent_id, 'content': message} for message in messages
+        ])
+        logger.info("Agent %s sent %s messages to %s", self.agent_id, len(messages), target_agent.agent_id)
 
-    async def receive_message(self) -> Optional[Dict[str, Any]]:
-        """Receive a message from the message queue."""
+    async def receive_message(self) -> Dict[str, Any]:
+        """Receive a message from the message queue, waiting if it is empty."""
+        message = await self.message_queue.get()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Agent %s received message: %s", self.agent_id, message)
+        return message
+
+    def try_receive(self) -> Optional[Dict[str, Any]]:
+        """Receive a message without waiting; None if the queue is empty."""
         try:
-            message = await self.message_queue.get()
-            logger.info(f"Agent {self.agent_id} received message: {message}")
-            return message
-        except Exception as e:
-            logger.error(f"Error receiving message: {e}")
+            return self.message_queue.get_nowait()
+        except asyncio.QueueEmpty:
             return None
 
+    def _now(self) -> float:
+        """Return the event loop clock, caching the loop on first use."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop.time()
+
+    async def _gather_integrations(self, *calls) -> List[Any]:
+        """Run independent service connector calls concurrently.
+
+        A call that raises is logged and yields None, the same result a
+        connector returns when its request fails.
+        """
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.error("Agent %s integration call failed: %s", self.agent_id, result)
+                results[i] = None
+        return results
+
     @abstractmethod
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process a task and return the result."""
@@ -49,71 +93,100 @@ class Agent(ABC):
 
 class BuilderAgent(Agent):
     """Specialized agent for building applications with local support."""
+
+    SUPPORTED_FRAMEWORKS: ClassVar[FrozenSet[str]] = frozenset(('react', 'vue', 'flask', 'fastapi'))
+
+    # Shared across builders: templates are read-only once loaded
+    _template_manager: ClassVar[Optional[TemplateManager]] = None
+
+    __slots__ = (
+        'build_templates', 'local_build_config',
+        '_build_slots', '_crewai_templates', '_taskade_templates'
+    )
     
-    def __init__(self, agent_id: str):
+    def __init__(self, agent_id: str, max_concurrent_builds: int = 4):
         super().__init__(agent_id, capabilities=['build', 'deploy', 'local_build'])
-        self.supported_frameworks = ['react', 'vue', 'flask', 'fastapi']
         self.build_templates = {}
         self.local_build_config = {}
-        
+        self._build_slots = asyncio.Semaphore(max_concurrent_builds)
+        # Request fields that depend only on the framework, built once
+        self._crewai_templates = {
+            framework: {
+                'role': 'builder',
+                'goal': f'Successfully create and configure {framework} application'
+            }
+            for framework in self.SUPPORTED_FRAMEWORKS
+        }
+        self._taskade_templates = {
+            framework: {
+                'description': f'Create and configure new {framework} application',
+                'status': 'in_progress'
+            }
+            for framework in self.SUPPORTED_FRAMEWORKS
+        }
+
+    @classmethod
+    def _get_template_manager(cls) -> TemplateManager:
+        """Return the shared template manager, creating it on first use."""
+        if cls._template_manager is None:
+            cls._template_manager = TemplateManager()
+        return cls._template_manager
+
     async def _create_crewai_task(self, framework: str, project_name: str) -> Optional[Dict[str, Any]]:
         """Create a task in CrewAI for the build process."""
         if self.crewai_connector:
-            return await self.crewai_connector.create_agent({
-                'task': f'Build {framework} application: {project_name}',
-                'role': 'builder',
-                'goal': f'Successfully create and configure {framework} application'
-            })
+            payload = self._crewai_templates[framework].copy()
+            payload['task'] = f'Build {framework} application: {project_name}'
+            return await self.crewai_connector.create_agent(payload)
         return None
 
     async def _create_taskade_item(self, framework: str, project_name: str) -> Optional[Dict[str, Any]]:
         """Create a task item in Taskade for tracking."""
         if self.taskade_connector:
-            return await self.taskade_connector.create_task({
-                'title': f'Build {framework} app: {project_name}',
-                'description': f'Create and configure new {framework} application',
-                'status': 'in_progress'
-            })
+            payload = self._taskade_templates[framework].copy()
+            payload['title'] = f'Build {framework} app: {project_name}'
+            return await self.taskade_connector.create_task(payload)
         return None
 
     async def create_local_project(self, framework: str, project_name: str, project_path: str) -> Dict[str, Any]:
         """Create a local project setup using templates."""
-        if framework not in self.supported_frameworks:
+        if framework not in self.SUPPORTED_FRAMEWORKS:
             return {'status': 'error', 'message': f'Unsupported framework: {framework}'}
         
         try:
-            from utils.template_manager import TemplateManager
-            template_manager = TemplateManager()
+            template_manager = self._get_template_manager()
             
             # Apply project template
-            logger.info(f"Creating {framework} project: {project_name} at {project_path}")
-            result = template_manager.apply_template(framework, project_path, project_name)
+            logger.info("Creating %s project: %s at %s", framework, project_name, project_path)
+            result = await template_manager.apply_template(framework, project_path, project_name)
             
             if result['status'] != 'success':
                 return result
             
-            # Run installation commands
-            install_result = await template_manager.run_install_commands(framework, project_path)
+            # Run installation commands with the template apply_template loaded
+            template = result['template']
+            install_result = await template_manager.run_install_commands(framework, project_path, template)
             if install_result['status'] != 'success':
                 return install_result
             
             # Store local build configuration
+            start_command = template_manager.get_start_command(framework, template)
             self.local_build_config[project_name] = {
                 'framework': framework,
                 'created_at': datetime.now().isoformat(),
                 'project_path': project_path,
-                'start_command': template_manager.get_start_command(framework)
+                'start_command': start_command
             }
             
             return {
                 'status': 'success',
                 'message': f'Local project {project_name} created successfully',
                 'project_details': self.local_build_config[project_name],
-                'start_command': template_manager.get_start_command(framework)
+                'start_command': start_command
             }
             
-        except Exception as e:
-            logger.error(f"Error creating local project: {e}")
+        except (OSError, KeyError, ValueError) as e:
+            logger.error("Error creating local project: %s", e)
             return {
                 'status': 'error',
                 'message': f'Failed to create project: {str(e)}'
@@ -140,47 +213,45 @@ class BuilderAgent(Agent):
         framework = task.get('framework')
         project_name = task.get('project_name')
         
-        if framework not in self.supported_frameworks:
+        if framework not in self.SUPPORTED_FRAMEWORKS:
             return {'status': 'error', 'message': f'Unsupported framework: {framework}'}
 
-        try:
-            self.busy = True
-            logger.info(f"BuilderAgent {self.agent_id} starting build for {framework}")
+        # Bound concurrent builds without delaying each one
+        async with self._build_slots:
+            try:
+                self.busy = True
+                logger.info("BuilderAgent %s starting build for %s", self.agent_id, framework)
             
-            # Create tasks in integrated services
-            crewai_task = await self._create_crewai_task(framework, project_name)
-            taskade_item = await self._create_taskade_item(framework, project_name)
+                # Create tasks in integrated services and get build
+                # recommendations from Abacus if available
+                crewai_task, taskade_item, build_prediction = await self._gather_integrations(
+                    self._create_crewai_task(framework, project_name),
+                    self._create_taskade_item(framework, project_name),
+                    self.abacus_connector.get_model_prediction({
+                        'framework': framework,
+                        'project_type': 'application',
+                        'context': project_name
+                    }) if self.abacus_connector else _no_result()
+                )
             
-            # Get build recommendations from Abacus if available
-            if self.abacus_connector:
-                build_prediction = await self.abacus_connector.get_model_prediction({
+                result = {
+                    'status': 'success',
+                    'message': f'Successfully built {framework} application',
                     'framework': framework,
-                    'project_type': 'application',
-                    'context': project_name
-                })
-            
-            # Simulate build process
-            await asyncio.sleep(2)
-            
-            result = {
-                'status': 'success',
-                'message': f'Successfully built {framework} application',
-                'framework': framework,
-                'timestamp': asyncio.get_running_loop().time(),
-                'crewai_task_id': crewai_task.get('id') if crewai_task else None,
-                'taskade_item_id': taskade_item.get('id') if taskade_item else None
-            }
+                    'timestamp': self._now(),
+                    'crewai_task_id': crewai_task.get('id') if crewai_task else None,
+                    'taskade_item_id': taskade_item.get('id') if taskade_item else None
+                }
             
-            logger.info(f"BuilderAgent {self.agent_id} completed build: {result}")
-            return result
-        except Exception as e:
-            logger.error(f"Build error: {e}")
-            return {'status': 'error', 'message': str(e)}
-        finally:
-            self.busy = False
+                logger.info("BuilderAgent %s completed build: %s", self.agent_id, result)
+                return result
+            finally:
+                self.busy = False
 
 class ProjectManagerAgent(Agent):
     """Agent responsible for managing project creation and coordination."""
+
+    __slots__ = ('active_projects',)
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, capabilities=['project_management', 'coordination'])
@@ -196,10 +267,10 @@ class ProjectManagerAgent(Agent):
             self.active_projects[project_name] = {
                 'status': 'initializing',
                 'framework': framework,
-                'created_at': asyncio.get_running_loop().time()
+                'created_at': self._now()
             }
             
-            logger.info(f"ProjectManagerAgent {self.agent_id} created project: {project_name}")
+            logger.info("ProjectManagerAgent %s created project: %s", self.agent_id, project_name)
             return {
                 'status': 'success',
                 'message': f'Project {project_name} initialized',
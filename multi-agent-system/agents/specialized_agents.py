@@ -1,15 +1,41 @@
-import asyncio
-from typing import Dict, List, Optional, Any
-from .agent import Agent
+from typing import Dict, Any
+from .agent import Agent, _no_result
 import logging
-import json
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# (expires_at, formatted) pairs so strftime runs once per day / minute
+_today_cache = (0.0, '')
+_minute_cache = (-1, '')
+
+def _today_str() -> str:
+    """Return the local date as YYYY-MM-DD, reformatted only after midnight."""
+    global _today_cache
+    now = time.time()
+    expires_at, value = _today_cache
+    if now >= expires_at:
+        today = datetime.fromtimestamp(now)
+        midnight = datetime.combine(today.date() + timedelta(days=1), datetime.min.time())
+        value = today.strftime("%Y-%m-%d")
+        _today_cache = (midnight.timestamp(), value)
+    return value
+
+def _minute_str() -> str:
+    """Return the local time as YYYY-MM-DD HH:MM, reformatted once a minute."""
+    global _minute_cache
+    now = time.time()
+    minute = int(now // 60)
+    if minute != _minute_cache[0]:
+        _minute_cache = (minute, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M"))
+    return _minute_cache[1]
 
 class TrendWatcherAgent(Agent):
     """Agent responsible for monitoring online trends and news."""
+
+    __slots__ = ('tracked_trends', 'news_cache')
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, capabilities=['trend_monitoring', 'news_analysis'])
@@ -21,32 +47,32 @@ class TrendWatcherAgent(Agent):
         task_type = task.get('type')
         
         if task_type == 'monitor_trends':
-            # Use CrewAI for trend analysis
-            if self.crewai_connector:
-                trend_analysis = await self.crewai_connector.create_agent({
+            # Use CrewAI for trend analysis and track trends in Taskade
+            trend_analysis, _ = await self._gather_integrations(
+                self.crewai_connector.create_agent({
                     'task': 'Analyze current online trends',
                     'role': 'trend_analyst',
                     'goal': 'Identify profitable content opportunities'
-                })
-                
-            # Track trends in Taskade
-            if self.taskade_connector:
-                await self.taskade_connector.create_task({
-                    'title': f'Trend Analysis: {datetime.now().strftime("%Y-%m-%d")}',
+                }) if self.crewai_connector else _no_result(),
+                self.taskade_connector.create_task({
+                    'title': f'Trend Analysis: {_today_str()}',
                     'description': f'Analyzing trends for content opportunities',
                     'status': 'in_progress'
-                })
+                }) if self.taskade_connector else _no_result()
+            )
             
             return {
                 'status': 'success',
                 'trends': trend_analysis if trend_analysis else [],
-                'timestamp': asyncio.get_running_loop().time()
+                'timestamp': self._now()
             }
             
         return {'status': 'error', 'message': 'Unsupported task type'}
 
 class ContentGeneratorAgent(Agent):
     """Agent responsible for generating faceless content."""
+
+    __slots__ = ('content_templates', 'performance_metrics')
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, capabilities=['content_generation', 'content_optimization'])
@@ -61,33 +87,33 @@ class ContentGeneratorAgent(Agent):
             content_type = task.get('content_type', 'article')
             topic = task.get('topic')
             
-            # Use CrewAI for content generation
-            if self.crewai_connector:
-                content = await self.crewai_connector.create_agent({
+            # Use CrewAI for content generation and Abacus for content optimization
+            content, optimization = await self._gather_integrations(
+                self.crewai_connector.create_agent({
                     'task': f'Generate {content_type} about {topic}',
                     'role': 'content_creator',
                     'goal': 'Create engaging, SEO-optimized content'
-                })
-            
-            # Use Abacus for content optimization
-            if self.abacus_connector:
-                optimization = await self.abacus_connector.get_model_prediction({
+                }) if self.crewai_connector else _no_result(),
+                self.abacus_connector.get_model_prediction({
                     'content_type': content_type,
                     'topic': topic,
                     'context': 'content_optimization'
-                })
+                }) if self.abacus_connector else _no_result()
+            )
             
             return {
                 'status': 'success',
                 'content': content if content else {},
                 'optimization_suggestions': optimization if optimization else {},
-                'timestamp': asyncio.get_running_loop().time()
+                'timestamp': self._now()
             }
             
         return {'status': 'error', 'message': 'Unsupported task type'}
 
 class CryptoTradingAgent(Agent):
     """Agent responsible for cryptocurrency trading."""
+
+    __slots__ = ('active_trades', 'trading_history', 'market_data')
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, capabilities=['crypto_trading', 'market_analysis'])
@@ -100,26 +126,24 @@ class CryptoTradingAgent(Agent):
         task_type = task.get('type')
         
         if task_type == 'analyze_market':
-            # Use Abacus for market prediction
-            if self.abacus_connector:
-                market_prediction = await self.abacus_connector.get_model_prediction({
+            # Use Abacus for market prediction and track analysis in Taskade
+            market_prediction, _ = await self._gather_integrations(
+                self.abacus_connector.get_model_prediction({
                     'market': 'crypto',
                     'symbols': task.get('symbols', ['BTC', 'ETH']),
                     'timeframe': task.get('timeframe', '1h')
-                })
-            
-            # Track analysis in Taskade
-            if self.taskade_connector:
-                await self.taskade_connector.create_task({
-                    'title': f'Crypto Analysis: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
+                }) if self.abacus_connector else _no_result(),
+                self.taskade_connector.create_task({
+                    'title': f'Crypto Analysis: {_minute_str()}',
                     'description': f'Market analysis for {task.get("symbols")}',
                     'status': 'in_progress'
-                })
+                }) if self.taskade_connector else _no_result()
+            )
             
             return {
                 'status': 'success',
                 'market_prediction': market_prediction if market_prediction else {},
-                'timestamp': asyncio.get_running_loop().time()
+                'timestamp': self._now()
             }
             
         elif task_type == 'execute_trade':
@@ -127,21 +151,19 @@ class CryptoTradingAgent(Agent):
             action = task.get('action')  # 'buy' or 'sell'
             amount = task.get('amount')
             
-            # Use CrewAI for trade validation
-            if self.crewai_connector:
-                trade_validation = await self.crewai_connector.create_agent({
+            # Use CrewAI for trade validation and record trade in Taskade
+            trade_validation, _ = await self._gather_integrations(
+                self.crewai_connector.create_agent({
                     'task': f'Validate {action} trade for {symbol}',
                     'role': 'trade_validator',
                     'goal': 'Ensure trade safety and compliance'
-                })
-            
-            # Record trade in Taskade
-            if self.taskade_connector:
-                await self.taskade_connector.create_task({
+                }) if self.crewai_connector else _no_result(),
+                self.taskade_connector.create_task({
                     'title': f'Crypto Trade: {symbol} {action}',
                     'description': f'{action.upper()} {amount} {symbol}',
                     'status': 'pending'
-                })
+                }) if self.taskade_connector else _no_result()
+            )
             
             return {
                 'status': 'success',
@@ -151,13 +173,15 @@ class CryptoTradingAgent(Agent):
                     'amount': amount,
                     'validation': trade_validation if trade_validation else {}
                 },
-                'timestamp': asyncio.get_running_loop().time()
+                'timestamp': self._now()
             }
             
         return {'status': 'error', 'message': 'Unsupported task type'}
 
 class OpportunityScoutAgent(Agent):
     """Agent responsible for identifying and evaluating business opportunities."""
+
+    __slots__ = ('opportunities', 'market_insights')
     
     def __init__(self, agent_id: str):
         super().__init__(agent_id, capabilities=['opportunity_analysis', 'market_research'])
@@ -169,34 +193,30 @@ class OpportunityScoutAgent(Agent):
         task_type = task.get('type')
         
         if task_type == 'scout_opportunities':
-            # Use CrewAI for opportunity analysis
-            if self.crewai_connector:
-                opportunities = await self.crewai_connector.create_agent({
+            # Use CrewAI for opportunity analysis, Abacus for market
+            # prediction, and track opportunities in Taskade
+            opportunities, market_analysis, _ = await self._gather_integrations(
+                self.crewai_connector.create_agent({
                     'task': 'Scout new business opportunities',
                     'role': 'opportunity_analyst',
                     'goal': 'Identify profitable business ventures'
-                })
-            
-            # Use Abacus for market prediction
-            if self.abacus_connector:
-                market_analysis = await self.abacus_connector.get_model_prediction({
+                }) if self.crewai_connector else _no_result(),
+                self.abacus_connector.get_model_prediction({
                     'analysis_type': 'market_opportunity',
                     'context': task.get('context', 'general')
-                })
-            
-            # Track opportunities in Taskade
-            if self.taskade_connector:
-                await self.taskade_connector.create_task({
-                    'title': f'Opportunity Analysis: {datetime.now().strftime("%Y-%m-%d")}',
+                }) if self.abacus_connector else _no_result(),
+                self.taskade_connector.create_task({
+                    'title': f'Opportunity Analysis: {_today_str()}',
                     'description': 'New business opportunity analysis',
                     'status': 'in_progress'
-                })
+                }) if self.taskade_connector else _no_result()
+            )
             
             return {
                 'status': 'success',
                 'opportunities': opportunities if opportunities else [],
                 'market_analysis': market_analysis if market_analysis else {},
-                'timestamp': asyncio.get_running_loop().time()
+                'timestamp': self._now()
             }
             
         return {'status': 'error', 'message': 'Unsupported task type'}
@@ -1,37 +1,51 @@
 import asyncio
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
 from agents.agent import Agent
 from integrations.service_connector import CrewAIConnector, TaskadeConnector, AbacusConnector
 import logging
 import os
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+_DEFAULT_PROJECTS_DIR = os.path.expanduser("~/projects")
 
 class Environment:
     """Class to manage the multi-agent environment with local development support."""
     
     def __init__(self):
         self.agents: Dict[str, Agent] = {}
+        # Agent ids by capability, in registration order
+        self._capability_index: Dict[str, List[str]] = defaultdict(list)
         self.crewai_connector: Optional[CrewAIConnector] = None
         self.taskade_connector: Optional[TaskadeConnector] = None
         self.abacus_connector: Optional[AbacusConnector] = None
-        self.local_projects_dir = os.path.expanduser("~/projects")
+        self.local_projects_dir = _DEFAULT_PROJECTS_DIR
         os.makedirs(self.local_projects_dir, exist_ok=True)
+        self._stop = asyncio.Event()
         logger.info("Environment initialized with local development support.")
 
     def set_service_connectors(self, 
                              crewai_connector: CrewAIConnector,
                              taskade_connector: TaskadeConnector,
                              abacus_connector: AbacusConnector):
-        """Set service connectors for the environment."""
+        """Set service connectors for the environment and every registered agent."""
         self.crewai_connector = crewai_connector
         self.taskade_connector = taskade_connector
         self.abacus_connector = abacus_connector
+        for agent in self.agents.values():
+            agent.crewai_connector = crewai_connector
+            agent.taskade_connector = taskade_connector
+            agent.abacus_connector = abacus_connector
 
     def register_agent(self, agent: Agent):
         """Register an agent in the environment and set up its service connectors."""
         self.agents[agent.agent_id] = agent
+        for capability in agent.capabilities:
+            agent_ids = self._capability_index[capability]
+            if agent.agent_id not in agent_ids:
+                agent_ids.append(agent.agent_id)
         
         # Set up service connectors for the agent
         agent.crewai_connector = self.crewai_connector
@@ -68,6 +82,22 @@ class Environment:
                 'message': str(e)
             }
 
+    def _find_agent(self, task: Dict[str, Any]) -> Optional[Agent]:
+        """Find the agent for a task by target id.
+
+        A task without a registered target may name a capability instead; it
+        goes to the first registered agent that has it.
+        """
+        for agent_id in task.get('target_agents') or ():
+            agent = self.agents.get(agent_id)
+            if agent:
+                return agent
+
+        agent_ids = self._capability_index.get(task.get('capability'))
+        if agent_ids:
+            return self.agents[agent_ids[0]]
+        return None
+
     async def distribute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Distribute a task to an appropriate agent."""
         # Handle local project creation
@@ -82,18 +112,20 @@ class Environment:
             # Add project path to task for the agent
             task['project_path'] = project_result['project_path']
         
-        # Find suitable agent for the task
-        for agent in self.agents.values():
-            if agent.agent_id in task.get('target_agents', []):
-                logger.info(f"Distributing task to {agent.agent_id}")
-                result = await agent.process_task(task)
-                logger.info(f"Task result from {agent.agent_id}: {result}")
-                return result
+        agent = self._find_agent(task)
+        if agent:
+            logger.info(f"Distributing task to {agent.agent_id}")
+            result = await agent.process_task(task)
+            logger.info(f"Task result from {agent.agent_id}: {result}")
+            return result
                 
         logger.warning("No suitable agent found for the task.")
         return {'status': 'error', 'message': 'No suitable agent found'}
 
     async def run(self):
-        """Run the environment and manage agent interactions."""
-        while True:
-            await asyncio.sleep(1)  # Keep the environment running
+        """Run the environment until stop() is called."""
+        await self._stop.wait()
+
+    def stop(self):
+        """Signal run() to return."""
+        self._stop.set()
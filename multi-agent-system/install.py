@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import asyncio
 import os
 import sys
 import shutil
@@ -10,63 +11,91 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_HOME = str(Path.home())
+
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, copying instead when linking is not possible."""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        os.remove(dst)
+        return _link_or_copy(src, dst)
+    except OSError:
+        # EXDEV, or a filesystem without hard link support
+        shutil.copy2(src, dst)
+    return dst
+
 class BoulevardInstaller:
     def __init__(self):
-        self.home_dir = str(Path.home())
+        self.home_dir = _HOME
         self.boulevard_dir = os.path.join(self.home_dir, '.boulevard')
         self.config_dir = os.path.join(self.boulevard_dir, 'config')
         self.install_dir = os.path.join(self.home_dir, 'boulevard')
+        self.config_path = os.path.join(self.config_dir, 'config.json')
+        self.launcher_path = os.path.join(self.install_dir, 'boulevard')
+        self.requirements_path = os.path.join(self.install_dir, 'requirements.txt')
+        self.data_dirs = [
+            os.path.join(self.boulevard_dir, name) for name in ('logs', 'data', 'keys')
+        ]
 
     def create_directories(self):
         """Create necessary directories for Boulevard."""
         dirs = [
             self.boulevard_dir,
             self.config_dir,
-            os.path.join(self.boulevard_dir, 'logs'),
-            os.path.join(self.boulevard_dir, 'data'),
-            os.path.join(self.boulevard_dir, 'keys'),
+            *self.data_dirs,
             self.install_dir
         ]
         
         for directory in dirs:
-            os.makedirs(directory, exist_ok=True)
+            Path(directory).mkdir(parents=True, exist_ok=True)
             logger.info(f"Created directory: {directory}")
 
-    def safe_copy(self, src, dst):
-        """Safely copy a file or directory."""
+    def safe_copy(self, src, dst, is_dir=None):
+        """Safely copy a file or directory.
+
+        ``is_dir`` may be passed when the caller already knows the type of
+        ``src`` (e.g. from a scandir entry) to avoid another stat.
+        """
+        if is_dir is None:
+            is_dir = os.path.isdir(src)
         try:
-            if os.path.isdir(src):
-                if os.path.exists(dst):
-                    shutil.rmtree(dst)
-                shutil.copytree(src, dst)
+            # Hard-link when source and destination share a filesystem so no
+            # file data is copied; fall back to copy2 across devices.
+            same_device = os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev
+            copy_function = _link_or_copy if same_device else shutil.copy2
+            if is_dir:
+                shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=copy_function)
                 logger.info(f"Copied directory: {os.path.basename(src)}")
             else:
-                if os.path.exists(dst):
-                    os.remove(dst)
-                shutil.copy2(src, dst)
+                copy_function(src, dst)
                 logger.info(f"Copied file: {os.path.basename(src)}")
         except Exception as e:
             logger.error(f"Error copying {src} to {dst}: {e}")
             raise
 
-    def copy_files(self):
+    def clean_install_dir(self):
+        """Remove any previous installation and recreate the install directory."""
+        if os.path.exists(self.install_dir):
+            shutil.rmtree(self.install_dir)
+        os.makedirs(self.install_dir)
+
+    def copy_files(self, clean=True):
         """Copy Boulevard files to installation directory."""
         current_dir = os.path.dirname(os.path.abspath(__file__))
         
         # First, clean the installation directory
-        if os.path.exists(self.install_dir):
-            shutil.rmtree(self.install_dir)
-        os.makedirs(self.install_dir)
+        if clean:
+            self.clean_install_dir()
         
         # Copy all Python files and directories
-        for item in os.listdir(current_dir):
-            src = os.path.join(current_dir, item)
-            dst = os.path.join(self.install_dir, item)
-            
-            if item == 'install.py' or item.startswith('.'):
-                continue
-                
-            self.safe_copy(src, dst)
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if entry.name == 'install.py' or entry.name.startswith('.'):
+                    continue
+                    
+                dst = os.path.join(self.install_dir, entry.name)
+                self.safe_copy(entry.path, dst, is_dir=entry.is_dir())
 
     def create_config_template(self):
         """Create a template configuration file."""
@@ -88,22 +117,19 @@ class BoulevardInstaller:
             }
         }
         
-        config_path = os.path.join(self.config_dir, 'config.json')
-        with open(config_path, 'w') as f:
-            json.dump(config_template, f, indent=2)
-        logger.info(f"Created configuration template: {config_path}")
+        Path(self.config_path).write_text(json.dumps(config_template, indent=2))
+        logger.info(f"Created configuration template: {self.config_path}")
 
     def create_launcher(self):
         """Create a launcher script for Boulevard."""
         launcher_content = f'''#!/bin/bash
 export PYTHONPATH="{self.install_dir}:$PYTHONPATH"
 cd {self.install_dir}
-python3 main.py --config {os.path.join(self.config_dir, 'config.json')} "$@"
+python3 main.py --config {self.config_path} "$@"
 '''
         
-        launcher_path = os.path.join(self.install_dir, 'boulevard')
-        with open(launcher_path, 'w') as f:
-            f.write(launcher_content)
+        launcher_path = self.launcher_path
+        Path(launcher_path).write_text(launcher_content)
         
         # Make launcher executable
         os.chmod(launcher_path, 0o755)
@@ -124,38 +150,61 @@ python3 main.py --config {os.path.join(self.config_dir, 'config.json')} "$@"
             "newsapi-python>=0.2.6"
         ]
         
-        req_path = os.path.join(self.install_dir, 'requirements.txt')
-        with open(req_path, 'w') as f:
-            f.write('\n'.join(requirements))
+        req_path = self.requirements_path
+        Path(req_path).write_text('\n'.join(requirements) + '\n')
         logger.info(f"Created requirements file: {req_path}")
 
+    def _pip_install_command(self):
+        return [
+            sys.executable, 
+            '-m', 
+            'pip', 
+            'install', 
+            '--user',
+            '-r', 
+            self.requirements_path
+        ]
+
     def install_dependencies(self):
         """Install required Python packages."""
         try:
-            subprocess.run([
-                sys.executable, 
-                '-m', 
-                'pip', 
-                'install', 
-                '--user',
-                '-r', 
-                os.path.join(self.install_dir, 'requirements.txt')
-            ], check=True)
+            subprocess.run(self._pip_install_command(), check=True)
             logger.info("Installed dependencies successfully")
         except subprocess.CalledProcessError as e:
             logger.error(f"Error installing dependencies: {e}")
             raise
 
+    async def install_dependencies_async(self):
+        """Install required Python packages without blocking the event loop."""
+        cmd = self._pip_install_command()
+        process = await asyncio.create_subprocess_exec(*cmd)
+        try:
+            returncode = await process.wait()
+        except BaseException:
+            # Cancelled, e.g. because copying files failed: don't leave pip running
+            if process.returncode is None:
+                process.kill()
+            raise
+        if returncode != 0:
+            e = subprocess.CalledProcessError(returncode, cmd)
+            logger.error(f"Error installing dependencies: {e}")
+            raise e
+        logger.info("Installed dependencies successfully")
+
     def install(self):
         """Run the complete installation process."""
+        asyncio.run(self.install_async())
+
+    async def install_async(self):
+        """Run the installation, copying files while dependencies install."""
         try:
             logger.info("Starting Boulevard installation...")
             
             # Create necessary directories
             self.create_directories()
             
-            # Copy files
-            self.copy_files()
+            # Clean the installation directory before anything is written to it
+            self.clean_install_dir()
             
             # Create configuration template
             self.create_config_template()
@@ -166,16 +215,19 @@ python3 main.py --config {os.path.join(self.config_dir, 'config.json')} "$@"
             # Create requirements.txt
             self.create_requirements()
             
-            # Install dependencies
-            self.install_dependencies()
+            # Copy files and install dependencies concurrently
+            await asyncio.gather(
+                asyncio.to_thread(self.copy_files, clean=False),
+                self.install_dependencies_async()
+            )
             
             # Print success message
             print("\nBoulevard has been successfully installed!")
             print("\nTo complete the setup:")
-            print(f"1. Edit the configuration file at: {os.path.join(self.config_dir, 'config.json')}")
+            print(f"1. Edit the configuration file at: {self.config_path}")
             print("2. Add your API keys to the configuration file")
             print(f"\nTo run Boulevard:")
-            print(f"{os.path.join(self.install_dir, 'boulevard')}")
+            print(self.launcher_path)
             print("\nOptionally, you can add Boulevard to your PATH:")
             print(f"echo 'export PATH=\"$PATH:{self.install_dir}\"' >> ~/.bashrc")
             print("source ~/.bashrc")
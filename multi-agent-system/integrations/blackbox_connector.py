@@ -2,8 +2,8 @@ import aiohttp
 import logging
 from typing import Dict, Any, Optional
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 class BlackBoxConnector:
     """Connector for BlackBox AI API integration."""
@@ -15,20 +15,46 @@ class BlackBoxConnector:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use.
+
+        BlackBox is a single host, so one keep-alive connection pool
+        serves every request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=20, limit_per_host=10, keepalive_timeout=75)
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the underlying HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
 
     async def code_completion(self, prompt: str) -> Optional[Dict[str, Any]]:
         """Get code completion from BlackBox AI."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/code-completion",
-                    headers=self.headers,
-                    json={"prompt": prompt}
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    logger.error(f"BlackBox API error: {response.status}")
-                    return None
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/code-completion",
+                json={"prompt": prompt}
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                logger.error(f"BlackBox API error: {response.status}")
+                return None
         except Exception as e:
             logger.error(f"Error calling BlackBox API: {e}")
             return None
@@ -36,16 +62,15 @@ class BlackBoxConnector:
     async def code_search(self, query: str) -> Optional[Dict[str, Any]]:
         """Search code using BlackBox AI."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/code-search",
-                    headers=self.headers,
-                    json={"query": query}
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    logger.error(f"BlackBox API error: {response.status}")
-                    return None
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/code-search",
+                json={"query": query}
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                logger.error(f"BlackBox API error: {response.status}")
+                return None
         except Exception as e:
             logger.error(f"Error calling BlackBox API: {e}")
             return None
@@ -53,16 +78,15 @@ class BlackBoxConnector:
     async def generate_documentation(self, code: str) -> Optional[Dict[str, Any]]:
         """Generate documentation for code using BlackBox AI."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/generate-docs",
-                    headers=self.headers,
-                    json={"code": code}
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    logger.error(f"BlackBox API error: {response.status}")
-                    return None
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/generate-docs",
+                json={"code": code}
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                logger.error(f"BlackBox API error: {response.status}")
+                return None
         except Exception as e:
             logger.error(f"Error calling BlackBox API: {e}")
             return None
@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 import aiohttp
-import json
-import os
+import hashlib
+import hmac
 import logging
+import time
 from datetime import datetime
+from urllib.parse import urlencode
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # API Configuration
 NEWSAPI_BASE_URL = "https://newsapi.org/v2"
@@ -15,38 +19,121 @@ BINANCE_BASE_URL = "https://api.binance.com/api/v3"
 TWITTER_API_BASE_URL = "https://api.twitter.com/2"
 REDDIT_API_BASE_URL = "https://oauth.reddit.com"
 
+def create_shared_session() -> aiohttp.ClientSession:
+    """Create a ClientSession with a connection pool sized for sharing across connectors."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
+    )
+
 class ServiceConnector(ABC):
-    """Base class for all service connectors and integrations."""
+    """Base class for all service connectors and integrations.
+
+    Connectors can be given a shared ClientSession so that they reuse one
+    connection pool; otherwise each opens and owns its own session.
+    """
+    
+    # Requests a *_many method keeps in flight at once
+    MAX_CONCURRENT_REQUESTS = 10
+    # Cached GET responses kept per connector
+    CACHE_SIZE = 256
     
-    def __init__(self, api_key: str, base_url: str):
+    def __init__(self, api_key: str, base_url: str, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key
         self.base_url = base_url
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
+        # Recent GET responses by (url, params), with the time they expire
+        self._cache: Dict[Tuple, Tuple[float, Any]] = OrderedDict()
+        # Lock and number of callers using it, for keys being fetched
+        self._cache_locks: Dict[Tuple, List] = {}
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
+            self.session = None
 
     @abstractmethod
     async def authenticate(self) -> bool:
         """Authenticate with the service."""
         pass
 
+    async def _cached_get(self, url: str, ttl: float, params: Optional[Dict[str, Any]] = None,
+                          headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """GET a JSON resource, reusing a response fetched less than ttl seconds ago.
+
+        Concurrent calls for the same url and params share a single request.
+        Failed requests are not cached. Every caller gets the same object, so
+        the result must not be modified.
+        """
+        key = (url, tuple(sorted(params.items())) if params else ())
+        hit = self._cache.get(key)
+        if hit and time.monotonic() < hit[0]:
+            return hit[1]
+        entry = self._cache_locks.get(key)
+        if entry is None:
+            entry = self._cache_locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                hit = self._cache.get(key)
+                if hit and time.monotonic() < hit[0]:
+                    return hit[1]
+                async with self.session.get(url, params=params, headers=headers) as response:
+                    if response.status != 200:
+                        return None
+                    data = await response.json()
+                self._store_cached(key, time.monotonic() + ttl, data)
+                return data
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._cache_locks[key]
+
+    def _store_cached(self, key: Tuple, expires: float, data: Any):
+        """Cache a response, dropping expired entries and then the oldest when full."""
+        cache = self._cache
+        cache[key] = (expires, data)
+        cache.move_to_end(key)
+        if len(cache) > self.CACHE_SIZE:
+            now = time.monotonic()
+            for stale in [k for k, (stale_expires, _) in cache.items() if stale_expires <= now]:
+                del cache[stale]
+            while len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
+
+    async def _gather_bounded(self, calls) -> List[Any]:
+        """Await coroutines concurrently, at most MAX_CONCURRENT_REQUESTS at a time."""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def bounded(call):
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(bounded(call) for call in calls))
+
 class CrewAIConnector(ServiceConnector):
     """Connector for CrewAI service."""
     
-    def __init__(self, api_key: str):
-        super().__init__(api_key, "https://api.crewai.com")  # Replace with actual CrewAI API URL
+    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(api_key, "https://api.crewai.com", session)  # Replace with actual CrewAI API URL
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
         
     async def authenticate(self) -> bool:
         try:
             async with self.session.get(
                 f"{self.base_url}/auth",
-                headers={"Authorization": f"Bearer {self.api_key}"}
+                headers=self._auth_headers
             ) as response:
                 return response.status == 200
         except Exception as e:
@@ -58,7 +145,7 @@ class CrewAIConnector(ServiceConnector):
         try:
             async with self.session.post(
                 f"{self.base_url}/agents",
-                headers={"Authorization": f"Bearer {self.api_key}"},
+                headers=self._auth_headers,
                 json=agent_config
             ) as response:
                 if response.status == 201:
@@ -71,14 +158,15 @@ class CrewAIConnector(ServiceConnector):
 class TaskadeConnector(ServiceConnector):
     """Connector for Taskade service."""
     
-    def __init__(self, api_key: str):
-        super().__init__(api_key, "https://api.taskade.com")  # Replace with actual Taskade API URL
+    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(api_key, "https://api.taskade.com", session)  # Replace with actual Taskade API URL
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
         
     async def authenticate(self) -> bool:
         try:
             async with self.session.get(
                 f"{self.base_url}/auth",
-                headers={"Authorization": f"Bearer {self.api_key}"}
+                headers=self._auth_headers
             ) as response:
                 return response.status == 200
         except Exception as e:
@@ -90,7 +178,7 @@ class TaskadeConnector(ServiceConnector):
         try:
             async with self.session.post(
                 f"{self.base_url}/tasks",
-                headers={"Authorization": f"Bearer {self.api_key}"},
+                headers=self._auth_headers,
                 json=task_data
             ) as response:
                 if response.status == 201:
@@ -103,8 +191,11 @@ class TaskadeConnector(ServiceConnector):
 class NewsAPIConnector(ServiceConnector):
     """Connector for NewsAPI service."""
     
-    def __init__(self, api_key: str):
-        super().__init__(api_key, NEWSAPI_BASE_URL)
+    # Seconds a trending-news response is reused
+    TRENDING_TTL = 30.0
+    
+    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(api_key, NEWSAPI_BASE_URL, session)
         
     async def authenticate(self) -> bool:
         try:
@@ -118,7 +209,7 @@ class NewsAPIConnector(ServiceConnector):
             return False
 
     async def get_trending_news(self, categories: List[str] = None) -> Optional[Dict[str, Any]]:
-        """Get trending news articles."""
+        """Get trending news articles. The result is shared with other callers; don't modify it."""
         try:
             params = {
                 "apiKey": self.api_key,
@@ -128,13 +219,7 @@ class NewsAPIConnector(ServiceConnector):
             if categories:
                 params["category"] = ",".join(categories)
                 
-            async with self.session.get(
-                f"{self.base_url}/top-headlines",
-                params=params
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+            return await self._cached_get(f"{self.base_url}/top-headlines", self.TRENDING_TTL, params=params)
         except Exception as e:
             logger.error(f"NewsAPI trending news error: {e}")
             return None
@@ -142,15 +227,27 @@ class NewsAPIConnector(ServiceConnector):
 class BinanceConnector(ServiceConnector):
     """Connector for Binance cryptocurrency exchange."""
     
-    def __init__(self, api_key: str, secret_key: str):
-        super().__init__(api_key, BINANCE_BASE_URL)
+    # Kept short so traders see fresh prices while parallel lookups coalesce
+    TICKER_TTL = 1.0
+    
+    def __init__(self, api_key: str, secret_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(api_key, BINANCE_BASE_URL, session)
         self.secret_key = secret_key
+        self._auth_headers = {"X-MBX-APIKEY": api_key}
+        # Keyed HMAC state, copied per request so the key is only set up once
+        self._hmac_template = hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+
+    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return params with the HMAC-SHA256 signature Binance requires on SIGNED endpoints."""
+        signer = self._hmac_template.copy()
+        signer.update(urlencode(params).encode())
+        return {**params, "signature": signer.hexdigest()}
         
     async def authenticate(self) -> bool:
         try:
             async with self.session.get(
                 f"{self.base_url}/ping",
-                headers={"X-MBX-APIKEY": self.api_key}
+                headers=self._auth_headers
             ) as response:
                 return response.status == 200
         except Exception as e:
@@ -158,19 +255,17 @@ class BinanceConnector(ServiceConnector):
             return False
 
     async def get_market_data(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Get market data for a specific trading pair."""
+        """Get market data for a specific trading pair. The result is shared with other callers; don't modify it."""
         try:
-            async with self.session.get(
-                f"{self.base_url}/ticker/24hr",
-                params={"symbol": symbol}
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+            return await self._cached_get(f"{self.base_url}/ticker/24hr", self.TICKER_TTL, params={"symbol": symbol})
         except Exception as e:
             logger.error(f"Binance market data error: {e}")
             return None
 
+    async def get_market_data_many(self, symbols: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get market data for several trading pairs, in the order given."""
+        return await self._gather_bounded(self.get_market_data(symbol) for symbol in symbols)
+
     async def execute_trade(self, symbol: str, side: str, quantity: float) -> Optional[Dict[str, Any]]:
         """Execute a trade on Binance."""
         try:
@@ -179,13 +274,14 @@ class BinanceConnector(ServiceConnector):
                 "side": side.upper(),
                 "type": "MARKET",
                 "quantity": quantity,
-                "timestamp": int(datetime.now().timestamp() * 1000)
+                "timestamp": int(time.time() * 1000)
             }
             
+            # Sent form-encoded in the body, which encodes exactly what was signed
             async with self.session.post(
                 f"{self.base_url}/order",
-                headers={"X-MBX-APIKEY": self.api_key},
-                params=params
+                headers=self._auth_headers,
+                data=self._sign(params)
             ) as response:
                 if response.status == 200:
                     return await response.json()
@@ -197,19 +293,41 @@ class BinanceConnector(ServiceConnector):
 class SocialMediaConnector(ServiceConnector):
     """Connector for social media trend monitoring."""
     
-    def __init__(self, twitter_api_key: str, reddit_api_key: str):
-        self.twitter_connector = TwitterConnector(twitter_api_key)
-        self.reddit_connector = RedditConnector(reddit_api_key)
+    def __init__(self, twitter_api_key: str, reddit_api_key: str,
+                 session: Optional[aiohttp.ClientSession] = None):
+        self.twitter_connector = TwitterConnector(twitter_api_key, session=session)
+        self.reddit_connector = RedditConnector(reddit_api_key, session=session)
+
+    async def __aenter__(self):
+        await self.twitter_connector.__aenter__()
+        await self.reddit_connector.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.twitter_connector.__aexit__(exc_type, exc_val, exc_tb)
+        await self.reddit_connector.__aexit__(exc_type, exc_val, exc_tb)
         
     async def authenticate(self) -> bool:
-        twitter_auth = await self.twitter_connector.authenticate()
-        reddit_auth = await self.reddit_connector.authenticate()
-        return twitter_auth and reddit_auth
+        twitter_auth, reddit_auth = await asyncio.gather(
+            self.twitter_connector.authenticate(),
+            self.reddit_connector.authenticate(),
+            return_exceptions=True
+        )
+        return twitter_auth is True and reddit_auth is True
 
     async def get_trending_topics(self) -> Dict[str, Any]:
         """Get trending topics from multiple social media platforms."""
-        twitter_trends = await self.twitter_connector.get_trends()
-        reddit_trends = await self.reddit_connector.get_trends()
+        twitter_trends, reddit_trends = await asyncio.gather(
+            self.twitter_connector.get_trends(),
+            self.reddit_connector.get_trends(),
+            return_exceptions=True
+        )
+        if isinstance(twitter_trends, Exception):
+            logger.error(f"Twitter trends error: {twitter_trends}")
+            twitter_trends = None
+        if isinstance(reddit_trends, Exception):
+            logger.error(f"Reddit trends error: {reddit_trends}")
+            reddit_trends = None
         
         return {
             "twitter": twitter_trends,
@@ -220,14 +338,18 @@ class SocialMediaConnector(ServiceConnector):
 class TwitterConnector(ServiceConnector):
     """Connector for Twitter API."""
     
-    def __init__(self, api_key: str):
-        super().__init__(api_key, TWITTER_API_BASE_URL)
+    # Seconds a trends response is reused
+    TRENDS_TTL = 60.0
+    
+    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(api_key, TWITTER_API_BASE_URL, session)
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
         
     async def authenticate(self) -> bool:
         try:
             async with self.session.get(
                 f"{self.base_url}/tweets/search/recent",
-                headers={"Authorization": f"Bearer {self.api_key}"}
+                headers=self._auth_headers
             ) as response:
                 return response.status == 200
         except Exception as e:
@@ -235,16 +357,14 @@ class TwitterConnector(ServiceConnector):
             return False
 
     async def get_trends(self) -> Optional[Dict[str, Any]]:
-        """Get trending topics on Twitter."""
+        """Get trending topics on Twitter. The result is shared with other callers; don't modify it."""
         try:
-            async with self.session.get(
+            return await self._cached_get(
                 f"{self.base_url}/trends/place",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                params={"id": 1}  # 1 for worldwide trends
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+                self.TRENDS_TTL,
+                params={"id": 1},  # 1 for worldwide trends
+                headers=self._auth_headers
+            )
         except Exception as e:
             logger.error(f"Twitter trends error: {e}")
             return None
@@ -252,14 +372,18 @@ class TwitterConnector(ServiceConnector):
 class RedditConnector(ServiceConnector):
     """Connector for Reddit API."""
     
-    def __init__(self, api_key: str):
-        super().__init__(api_key, REDDIT_API_BASE_URL)
+    # Seconds a trends response is reused
+    TRENDS_TTL = 60.0
+    
+    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(api_key, REDDIT_API_BASE_URL, session)
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
         
     async def authenticate(self) -> bool:
         try:
             async with self.session.get(
                 f"{self.base_url}/api/v1/me",
-                headers={"Authorization": f"Bearer {self.api_key}"}
+                headers=self._auth_headers
             ) as response:
                 return response.status == 200
         except Exception as e:
@@ -267,16 +391,14 @@ class RedditConnector(ServiceConnector):
             return False
 
     async def get_trends(self) -> Optional[Dict[str, Any]]:
-        """Get trending topics on Reddit."""
+        """Get trending topics on Reddit. The result is shared with other callers; don't modify it."""
         try:
-            async with self.session.get(
+            return await self._cached_get(
                 f"{self.base_url}/r/all/hot",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                params={"limit": 25}
-            ) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+                self.TRENDS_TTL,
+                params={"limit": 25},
+                headers=self._auth_headers
+            )
         except Exception as e:
             logger.error(f"Reddit trends error: {e}")
             return None
@@ -284,14 +406,15 @@ class RedditConnector(ServiceConnector):
 class AbacusConnector(ServiceConnector):
     """Connector for Abacus service."""
     
-    def __init__(self, api_key: str):
-        super().__init__(api_key, "https://api.abacus.ai")
+    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(api_key, "https://api.abacus.ai", session)
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
         
     async def authenticate(self) -> bool:
         try:
             async with self.session.get(
                 f"{self.base_url}/auth",
-                headers={"Authorization": f"Bearer {self.api_key}"}
+                headers=self._auth_headers
             ) as response:
                 return response.status == 200
         except Exception as e:
@@ -303,7 +426,7 @@ class AbacusConnector(ServiceConnector):
         try:
             async with self.session.post(
                 f"{self.base_url}/predict",
-                headers={"Authorization": f"Bearer {self.api_key}"},
+                headers=self._auth_headers,
                 json=data
             ) as response:
                 if response.status == 200:
@@ -312,3 +435,7 @@ class AbacusConnector(ServiceConnector):
         except Exception as e:
             logger.error(f"Abacus prediction error: {e}")
             return None
+
+    async def predict_many(self, data_list: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Get predictions for several inputs, in the order given."""
+        return await self._gather_bounded(self.get_model_prediction(data) for data in data_list)
@@ -1,25 +1,89 @@
 import asyncio
 import argparse
 import logging
-import json
-import os
-from typing import Dict, Any
+import logging.config
+from typing import Dict, Any, Optional
+import aiohttp
 from agents.agent import BuilderAgent, ProjectManagerAgent
 from environment.environment import Environment
+from integrations.service_connector import (
+    CrewAIConnector, TaskadeConnector, AbacusConnector, create_shared_session
+)
 from memory.memory_manager import MemoryManager
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+
 logger = logging.getLogger(__name__)
 
+# The one place logging is configured; library modules only attach a NullHandler
+LOGGING_CONFIG = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'default': {'format': '%(levelname)s:%(name)s:%(message)s'}
+    },
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler', 'formatter': 'default'}
+    },
+    'root': {'level': 'INFO', 'handlers': ['console']}
+}
+
 class LocalAppBuilder:
     """Local application builder system."""
     
     def __init__(self):
-        self.memory = MemoryManager()
+        self._memory: Optional[MemoryManager] = None
+        self._memory_lock = asyncio.Lock()
         self.environment = Environment()
+        self._http: Optional[aiohttp.ClientSession] = None
         self.setup_agents()
         logger.info("Local App Builder system initialized")
 
+    async def memory(self) -> MemoryManager:
+        """Return the memory store, opening it on first use.
+
+        Opening creates directories, reads the encryption key and runs the
+        schema setup, so it happens on a worker thread and only for commands
+        that touch memory.
+        """
+        if self._memory is None:
+            async with self._memory_lock:
+                if self._memory is None:
+                    self._memory = await asyncio.to_thread(MemoryManager)
+        return self._memory
+
+    async def setup_service_connectors(self):
+        """Create connectors for stored API keys, sharing one HTTP session."""
+        keys = await (await self.memory()).get_api_keys()
+        if not any(keys.get(service) for service in ('crewai', 'taskade', 'abacus')):
+            return
+
+        self._http = create_shared_session()
+        self.environment.set_service_connectors(
+            CrewAIConnector(keys['crewai'], session=self._http) if keys.get('crewai') else None,
+            TaskadeConnector(keys['taskade'], session=self._http) if keys.get('taskade') else None,
+            AbacusConnector(keys['abacus'], session=self._http) if keys.get('abacus') else None
+        )
+        logger.info("Service connectors initialized")
+
+    async def close(self):
+        """Close the shared HTTP session and the memory store."""
+        if self._http:
+            await self._http.close()
+            self._http = None
+        if self._memory is not None:
+            await self._memory.stop_writer()
+            self._memory.close()
+            self._memory = None
+
     def setup_agents(self):
         """Initialize and register the required agents."""
         try:
@@ -65,7 +129,7 @@ class LocalAppBuilder:
             
             if build_result['status'] == 'success':
                 # Store project details in memory
-                self.memory.store_project_details(project_name, {
+                await (await self.memory()).store_project_details(project_name, {
                     'framework': framework,
                     'status': 'created',
                     'build_result': build_result
@@ -83,7 +147,7 @@ class LocalAppBuilder:
     async def list_projects(self) -> Dict[str, Any]:
         """List all local projects."""
         try:
-            projects = self.memory.get_all_projects()
+            projects = await (await self.memory()).get_all_projects()
             return {
                 'status': 'success',
                 'projects': projects
@@ -96,6 +160,14 @@ class LocalAppBuilder:
             }
 
 async def main():
+    logging.config.dictConfig(LOGGING_CONFIG)
+
+    # Python 3.12+ can start tasks eagerly, so agent coroutines that finish
+    # without blocking skip event loop scheduling
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    
     parser = argparse.ArgumentParser(description='Local App Builder - Create and manage local applications')
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
@@ -118,11 +190,13 @@ async def main():
     
     try:
         if args.command == 'create':
+            await app_builder.setup_service_connectors()
             logger.info(f"Creating new {args.framework} project: {args.name}")
             result = await app_builder.create_project(args.framework, args.name)
             if result['status'] == 'success':
                 logger.info(f"Successfully created project {args.name}")
-                logger.info(f"Project details: {json.dumps(result, indent=2)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Project details: %s", _dumps(result))
             else:
                 logger.error(f"Failed to create project: {result['message']}")
                 
@@ -131,7 +205,7 @@ async def main():
             if result['status'] == 'success':
                 logger.info("Available projects:")
                 for project in result['projects']:
-                    logger.info(f"- {project['name']} ({project['framework']})")
+                    logger.info("- %s (%s)", project['name'], project['framework'])
             else:
                 logger.error(f"Failed to list projects: {result['message']}")
                 
@@ -139,6 +213,8 @@ async def main():
         logger.info("Shutting down Local App Builder...")
     except Exception as e:
         logger.error(f"Error in Local App Builder: {e}")
+    finally:
+        await app_builder.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,39 +1,272 @@
+import asyncio
 import json
 import os
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 import sqlite3
-from pathlib import Path
+import threading
+import time
+from contextlib import contextmanager
 from cryptography.fernet import Fernet
 import logging
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _loads, _dumps = json.loads, json.dumps
+
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Columns holding unix-millisecond timestamps
+_TIMESTAMP_COLUMNS = (
+    ('api_keys', 'last_updated'),
+    ('trends', 'timestamp'),
+    ('content', 'created_at'),
+    ('trades', 'timestamp'),
+    ('agent_states', 'last_updated'),
+    ('projects', 'last_updated'),
+)
+
+def _now_ms() -> int:
+    """Current time as integer unix milliseconds."""
+    return int(time.time() * 1000)
+
+# Statements used on hot paths. Keeping each one a single constant string
+# lets sqlite3's per-connection statement cache reuse the prepared statement
+# instead of re-parsing the SQL on every call.
+_SQL_UPSERT_API_KEY = '''
+    INSERT OR REPLACE INTO api_keys (service, encrypted_key, last_updated)
+    VALUES (?, ?, ?)
+'''
+_SQL_API_KEYS_STAMP = 'SELECT MAX(last_updated), COUNT(*) FROM api_keys'
+_SQL_GET_API_KEYS = 'SELECT service, encrypted_key FROM api_keys'
+_SQL_INSERT_TREND = '''
+    INSERT INTO trends (source, trend_data, timestamp)
+    VALUES (?, ?, ?)
+'''
+_SQL_INSERT_CONTENT = '''
+    INSERT INTO content (type, content_data, performance_metrics, created_at)
+    VALUES (?, ?, ?, ?)
+'''
+_SQL_INSERT_TRADE = '''
+    INSERT INTO trades (symbol, action, amount, price, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+'''
+_SQL_UPSERT_AGENT_STATE = '''
+    INSERT OR REPLACE INTO agent_states (agent_id, state_data, last_updated)
+    VALUES (?, ?, ?)
+'''
+_SQL_GET_AGENT_STATE = 'SELECT state_data FROM agent_states WHERE agent_id = ?'
+_SQL_UPSERT_PROJECT = '''
+    INSERT OR REPLACE INTO projects (name, project_data, last_updated)
+    VALUES (?, ?, ?)
+'''
+_SQL_GET_PROJECTS = 'SELECT name, project_data FROM projects ORDER BY name'
+_SQL_GET_TRENDS = '''
+    SELECT source, trend_data, timestamp
+    FROM trends
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_CONTENT = '''
+    SELECT type, content_data, performance_metrics, created_at
+    FROM content
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_CONTENT_BY_TYPE = '''
+    SELECT type, content_data, performance_metrics, created_at
+    FROM content
+    WHERE type = ?
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_TRADES = '''
+    SELECT symbol, action, amount, price, timestamp
+    FROM trades
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+'''
+_SQL_GET_TRADES_BY_SYMBOL = '''
+    SELECT symbol, action, amount, price, timestamp
+    FROM trades
+    WHERE symbol = ?
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+'''
 
 class MemoryManager:
     """Manages persistent storage and memory for Boulevard."""
+
+    # Background writer limits: rows per executemany, how long to wait for a
+    # batch to fill before flushing it, and how many rows may be pending
+    # before callers fall back to writing inline.
+    WRITE_BATCH_SIZE = 256
+    WRITE_BATCH_DELAY = 0.02
+    WRITE_QUEUE_SIZE = 1024
+    # Rows fetched per round trip by the iter_* readers
+    READ_CHUNK_SIZE = 256
+    # Fernet ciphers by data_dir, so reopening a store skips reading its key
+    _cipher_cache: Dict[str, Fernet] = {}
     
     def __init__(self, data_dir: str = "~/.boulevard"):
         self.data_dir = os.path.expanduser(data_dir)
+        self._db_path = os.path.join(self.data_dir, 'boulevard.db')
+        self._keys_dir = os.path.join(self.data_dir, 'keys')
+        self._cache_dir = os.path.join(self.data_dir, 'cache')
+        self._logs_dir = os.path.join(self.data_dir, 'logs')
         self.setup_storage()
-        self.encryption_key = self._load_or_create_key()
-        self.cipher_suite = Fernet(self.encryption_key)
+        cipher_suite = MemoryManager._cipher_cache.get(self.data_dir)
+        if cipher_suite is None:
+            cipher_suite = Fernet(self._load_or_create_key())
+            MemoryManager._cipher_cache[self.data_dir] = cipher_suite
+        self.cipher_suite = cipher_suite
+        # One connection for the lifetime of the manager; the lock serializes
+        # access since it may be shared between threads.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-20000;"
+            "PRAGMA cache_spill=OFF;"
+        )
         self._init_database()
+        # Decrypted API keys, valid while the api_keys table's stamp is unchanged
+        self._keys_cache: Optional[Dict[str, str]] = None
+        self._keys_cache_stamp: Optional[Tuple[Any, int]] = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Run statements on the shared connection inside one transaction."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                raise
+            cursor.execute('COMMIT')
+
+    async def _run(self, func, *args):
+        """Run a blocking database call on a worker thread."""
+        return await asyncio.to_thread(func, *args)
+
+    def start_writer(self):
+        """Start batching trend, trade and content writes in the background.
+
+        Must be called from a running event loop. Until stop_writer() is
+        awaited, store_trend, store_trade and store_content enqueue their row
+        and return immediately; a writer task flushes rows in batches.
+        """
+        if self._writer_task is None:
+            self._write_queue = asyncio.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+            self._writer_task = asyncio.create_task(self._drain())
+
+    async def stop_writer(self):
+        """Flush queued writes and stop the background writer."""
+        if self._writer_task is None:
+            return
+        await self._write_queue.put(None)
+        await self._writer_task
+        self._writer_task = None
+        self._write_queue = None
+
+    def _enqueue_write(self, sql: str, row: Tuple) -> bool:
+        """Queue an insert for the background writer; False if it must be written inline.
+
+        Rows are queued fully bound, timestamp included, so bad input is
+        rejected by the caller and the time is when the row was stored.
+        """
+        if self._writer_task is None or self._writer_task.done():
+            return False
+        try:
+            self._write_queue.put_nowait((sql, row))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _drain(self):
+        """Collect queued rows into batches and write them off the event loop."""
+        queue = self._write_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            batch = []
+            deadline = loop.time() + self.WRITE_BATCH_DELAY
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.WRITE_BATCH_SIZE:
+                    break
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+            if batch:
+                try:
+                    await self._run(self._write_batch, batch)
+                except Exception as e:
+                    logger.error(f"Error writing batch of {len(batch)} rows: {e}")
+            if item is None:
+                return
+
+    def _write_batch(self, batch: List[Tuple[str, Tuple]]):
+        """Write queued rows with one batched insert per table.
+
+        Each table is written in its own transaction, so a failure loses only
+        that table's rows.
+        """
+        tables: Dict[str, List[Tuple]] = {}
+        for sql, row in batch:
+            tables.setdefault(sql, []).append(row)
+        for sql, rows in tables.items():
+            try:
+                self._insert_rows(sql, rows)
+            except Exception as e:
+                logger.error(f"Error writing batch of {len(rows)} rows: {e}")
+
+    def _insert_rows(self, sql: str, rows: List[Tuple]):
+        with self._transaction() as cursor:
+            cursor.executemany(sql, rows)
 
     def setup_storage(self):
         """Set up the storage directory structure."""
-        os.makedirs(self.data_dir, exist_ok=True)
-        os.makedirs(os.path.join(self.data_dir, 'keys'), exist_ok=True)
-        os.makedirs(os.path.join(self.data_dir, 'cache'), exist_ok=True)
-        os.makedirs(os.path.join(self.data_dir, 'logs'), exist_ok=True)
+        # makedirs creates data_dir itself along with the first subdirectory
+        os.makedirs(self._keys_dir, exist_ok=True)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        os.makedirs(self._logs_dir, exist_ok=True)
 
     def _load_or_create_key(self) -> bytes:
         """Load or create encryption key."""
-        key_path = os.path.join(self.data_dir, 'keys', 'encryption.key')
-        if os.path.exists(key_path):
+        key_path = os.path.join(self._keys_dir, 'encryption.key')
+        try:
             with open(key_path, 'rb') as key_file:
                 return key_file.read()
-        else:
+        except FileNotFoundError:
             key = Fernet.generate_key()
             with open(key_path, 'wb') as key_file:
                 key_file.write(key)
@@ -41,16 +274,13 @@ class MemoryManager:
 
     def _init_database(self):
         """Initialize the SQLite database."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            
+        with self._transaction() as cursor:
             # API Keys table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS api_keys (
                     service TEXT PRIMARY KEY,
                     encrypted_key TEXT,
-                    last_updated TIMESTAMP
+                    last_updated INTEGER
                 )
             ''')
             
@@ -60,7 +290,7 @@ class MemoryManager:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     source TEXT,
                     trend_data TEXT,
-                    timestamp TIMESTAMP
+                    timestamp INTEGER
                 )
             ''')
             
@@ -71,7 +301,7 @@ class MemoryManager:
                     type TEXT,
                     content_data TEXT,
                     performance_metrics TEXT,
-                    created_at TIMESTAMP
+                    created_at INTEGER
                 )
             ''')
             
@@ -83,7 +313,7 @@ class MemoryManager:
                     action TEXT,
                     amount REAL,
                     price REAL,
-                    timestamp TIMESTAMP
+                    timestamp INTEGER
                 )
             ''')
             
@@ -92,166 +322,245 @@ class MemoryManager:
                 CREATE TABLE IF NOT EXISTS agent_states (
                     agent_id TEXT PRIMARY KEY,
                     state_data TEXT,
-                    last_updated TIMESTAMP
+                    last_updated INTEGER
                 )
             ''')
             
-            conn.commit()
+            # Projects table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS projects (
+                    name TEXT PRIMARY KEY,
+                    project_data TEXT,
+                    last_updated INTEGER
+                )
+            ''')
 
-    def store_api_keys(self, keys: Dict[str, str]):
+            # Indexes backing the ORDER BY ... DESC LIMIT reads, with and
+            # without their optional equality filter
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trends_ts ON trends(timestamp DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_ts ON content(created_at DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_content_type_ts ON content(type, created_at DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_ts ON trades(timestamp DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_symbol_ts ON trades(symbol, timestamp DESC)')
+
+            # Timestamps used to be stored as local-time datetime strings;
+            # convert any such rows to unix milliseconds once
+            cursor.execute('PRAGMA user_version')
+            if cursor.fetchone()[0] < 1:
+                for table, column in _TIMESTAMP_COLUMNS:
+                    cursor.execute(
+                        f"UPDATE {table} SET {column} = "
+                        f"CAST((julianday({column}, 'utc') - 2440587.5) * 86400000 AS INTEGER) "
+                        f"WHERE typeof({column}) = 'text'"
+                    )
+                cursor.execute('PRAGMA user_version = 1')
+
+    async def store_api_keys(self, keys: Dict[str, str]):
         """Securely store API keys."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
+        await self._run(self._store_api_keys, keys)
+
+    def _store_api_keys(self, keys: Dict[str, str]):
+        now = _now_ms()
+        with self._transaction() as cursor:
             for service, key in keys.items():
                 encrypted_key = self.cipher_suite.encrypt(key.encode())
-                cursor.execute('''
-                    INSERT OR REPLACE INTO api_keys (service, encrypted_key, last_updated)
-                    VALUES (?, ?, ?)
-                ''', (service, encrypted_key.decode(), datetime.now()))
-            conn.commit()
-
-    def get_api_keys(self) -> Dict[str, str]:
-        """Retrieve stored API keys."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
+                cursor.execute(_SQL_UPSERT_API_KEY, (service, encrypted_key.decode(), now))
+            # Still holding the lock: a replacement in the same millisecond
+            # leaves the stamp unchanged, so don't rely on it for our own writes
+            self._keys_cache = None
+
+    async def get_api_keys(self) -> Dict[str, str]:
+        """Retrieve stored API keys.
+
+        Decrypted keys are cached until a key is added or replaced, so
+        repeated calls skip decryption. Writes through this manager clear the
+        cache; the (MAX(last_updated), COUNT(*)) stamp catches writes made by
+        other connections.
+        """
+        return await self._run(self._get_api_keys)
+
+    def _get_api_keys(self) -> Dict[str, str]:
         keys = {}
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT service, encrypted_key FROM api_keys')
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_API_KEYS_STAMP)
+            stamp = cursor.fetchone()
+            if self._keys_cache is not None and stamp == self._keys_cache_stamp:
+                return dict(self._keys_cache)
+            cursor.execute(_SQL_GET_API_KEYS)
             for service, encrypted_key in cursor.fetchall():
                 decrypted_key = self.cipher_suite.decrypt(encrypted_key.encode()).decode()
                 keys[service] = decrypted_key
-        return keys
+            self._keys_cache = keys
+            self._keys_cache_stamp = stamp
+        return dict(keys)
 
-    def store_trend(self, source: str, trend_data: Dict[str, Any]):
+    async def store_trend(self, source: str, trend_data: Dict[str, Any]):
         """Store trend information."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO trends (source, trend_data, timestamp)
-                VALUES (?, ?, ?)
-            ''', (source, json.dumps(trend_data), datetime.now()))
-            conn.commit()
+        row = (source, _dumps(trend_data), _now_ms())
+        if not self._enqueue_write(_SQL_INSERT_TREND, row):
+            await self._run(self._insert_rows, _SQL_INSERT_TREND, [row])
+
+    async def store_trends(self, trends: List[Tuple[str, Dict[str, Any]]]):
+        """Store several (source, trend_data) records in one transaction."""
+        await self._run(self._store_trends, trends)
 
-    def store_content(self, content_type: str, content_data: Dict[str, Any], metrics: Dict[str, Any]):
+    def _store_trends(self, trends: List[Tuple[str, Dict[str, Any]]]):
+        now = _now_ms()
+        self._insert_rows(_SQL_INSERT_TREND, [(source, _dumps(trend_data), now) for source, trend_data in trends])
+
+    async def store_content(self, content_type: str, content_data: Dict[str, Any], metrics: Dict[str, Any]):
         """Store generated content and its performance metrics."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO content (type, content_data, performance_metrics, created_at)
-                VALUES (?, ?, ?, ?)
-            ''', (content_type, json.dumps(content_data), json.dumps(metrics), datetime.now()))
-            conn.commit()
+        row = (content_type, _dumps(content_data), _dumps(metrics), _now_ms())
+        if not self._enqueue_write(_SQL_INSERT_CONTENT, row):
+            await self._run(self._insert_rows, _SQL_INSERT_CONTENT, [row])
+
+    async def store_contents(self, contents: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]):
+        """Store several (content_type, content_data, metrics) records in one transaction."""
+        await self._run(self._store_contents, contents)
+
+    def _store_contents(self, contents: List[Tuple[str, Dict[str, Any], Dict[str, Any]]]):
+        now = _now_ms()
+        self._insert_rows(_SQL_INSERT_CONTENT, [
+            (content_type, _dumps(content_data), _dumps(metrics), now)
+            for content_type, content_data, metrics in contents
+        ])
 
-    def store_trade(self, trade_data: Dict[str, Any]):
+    async def store_trade(self, trade_data: Dict[str, Any]):
         """Store trade information."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO trades (symbol, action, amount, price, timestamp)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                trade_data['symbol'],
-                trade_data['action'],
-                trade_data['amount'],
-                trade_data['price'],
-                datetime.now()
-            ))
-            conn.commit()
-
-    def store_agent_state(self, agent_id: str, state_data: Dict[str, Any]):
+        row = self._trade_row(trade_data, _now_ms())
+        if not self._enqueue_write(_SQL_INSERT_TRADE, row):
+            await self._run(self._insert_rows, _SQL_INSERT_TRADE, [row])
+
+    async def store_trades(self, trades: List[Dict[str, Any]]):
+        """Store several trades in one transaction."""
+        await self._run(self._store_trades, trades)
+
+    @staticmethod
+    def _trade_row(trade_data: Dict[str, Any], timestamp: int) -> Tuple:
+        return (
+            trade_data['symbol'],
+            trade_data['action'],
+            trade_data['amount'],
+            trade_data['price'],
+            timestamp
+        )
+
+    def _store_trades(self, trades: List[Dict[str, Any]]):
+        now = _now_ms()
+        self._insert_rows(_SQL_INSERT_TRADE, [self._trade_row(trade_data, now) for trade_data in trades])
+
+    async def store_agent_state(self, agent_id: str, state_data: Dict[str, Any]):
         """Store agent state information."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO agent_states (agent_id, state_data, last_updated)
-                VALUES (?, ?, ?)
-            ''', (agent_id, json.dumps(state_data), datetime.now()))
-            conn.commit()
+        await self._run(self._store_agent_state, agent_id, state_data)
 
-    def get_agent_state(self, agent_id: str) -> Optional[Dict[str, Any]]:
+    def _store_agent_state(self, agent_id: str, state_data: Dict[str, Any]):
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_UPSERT_AGENT_STATE, (agent_id, _dumps(state_data), _now_ms()))
+
+    async def get_agent_state(self, agent_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve agent state information."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT state_data FROM agent_states WHERE agent_id = ?', (agent_id,))
+        return await self._run(self._get_agent_state, agent_id)
+
+    def _get_agent_state(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_GET_AGENT_STATE, (agent_id,))
             result = cursor.fetchone()
             if result:
-                return json.loads(result[0])
+                return _loads(result[0])
         return None
 
-    def get_recent_trends(self, limit: int = 10) -> list:
+    async def store_project_details(self, project_name: str, details: Dict[str, Any]):
+        """Store or replace the details of a local project."""
+        await self._run(self._store_project_details, project_name, details)
+
+    def _store_project_details(self, project_name: str, details: Dict[str, Any]):
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_UPSERT_PROJECT, (project_name, _dumps(details), _now_ms()))
+
+    async def get_all_projects(self) -> List[Dict[str, Any]]:
+        """Retrieve all stored projects, each with its name and details."""
+        return [
+            {'name': row[0], **_loads(row[1])}
+            async for row in self._iter_rows(_SQL_GET_PROJECTS, ())
+        ]
+
+    def _execute(self, query: str, params) -> sqlite3.Cursor:
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(query, params)
+        return cursor
+
+    def _fetch_chunk(self, cursor: sqlite3.Cursor) -> list:
+        with self._lock:
+            return cursor.fetchmany(self.READ_CHUNK_SIZE)
+
+    async def _iter_rows(self, query: str, params) -> AsyncIterator[tuple]:
+        """Yield rows of a query, fetching them in chunks on a worker thread.
+
+        The lock is only held while fetching, never across a yield, so the
+        consumer can use the manager while iterating.
+        """
+        cursor = await self._run(self._execute, query, params)
+        try:
+            while True:
+                rows = await self._run(self._fetch_chunk, cursor)
+                if not rows:
+                    return
+                for row in rows:
+                    yield row
+        finally:
+            cursor.close()
+
+    async def iter_recent_trends(self, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Yield recent trends one at a time."""
+        async for row in self._iter_rows(_SQL_GET_TRENDS, (limit,)):
+            yield {
+                'source': row[0],
+                'data': _loads(row[1]),
+                'timestamp': row[2]
+            }
+
+    async def get_recent_trends(self, limit: int = 10) -> list:
         """Retrieve recent trends."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT source, trend_data, timestamp 
-                FROM trends 
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            ''', (limit,))
-            return [
-                {
-                    'source': row[0],
-                    'data': json.loads(row[1]),
-                    'timestamp': row[2]
-                }
-                for row in cursor.fetchall()
-            ]
-
-    def get_content_performance(self, content_type: str = None, limit: int = 10) -> list:
+        return [trend async for trend in self.iter_recent_trends(limit)]
+
+    async def iter_content_performance(self, content_type: str = None, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Yield content performance metrics one record at a time."""
+        if content_type:
+            rows = self._iter_rows(_SQL_GET_CONTENT_BY_TYPE, (content_type, limit))
+        else:
+            rows = self._iter_rows(_SQL_GET_CONTENT, (limit,))
+        async for row in rows:
+            yield {
+                'type': row[0],
+                'content': _loads(row[1]),
+                'metrics': _loads(row[2]),
+                'created_at': row[3]
+            }
+
+    async def get_content_performance(self, content_type: str = None, limit: int = 10) -> list:
         """Retrieve content performance metrics."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            query = '''
-                SELECT type, content_data, performance_metrics, created_at 
-                FROM content 
-            '''
-            params = []
-            if content_type:
-                query += ' WHERE type = ?'
-                params.append(content_type)
-            query += ' ORDER BY created_at DESC LIMIT ?'
-            params.append(limit)
-            
-            cursor.execute(query, params)
-            return [
-                {
-                    'type': row[0],
-                    'content': json.loads(row[1]),
-                    'metrics': json.loads(row[2]),
-                    'created_at': row[3]
-                }
-                for row in cursor.fetchall()
-            ]
-
-    def get_trade_history(self, symbol: str = None, limit: int = 10) -> list:
+        return [content async for content in self.iter_content_performance(content_type, limit)]
+
+    async def iter_trade_history(self, symbol: str = None, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Yield trade history one trade at a time."""
+        if symbol:
+            rows = self._iter_rows(_SQL_GET_TRADES_BY_SYMBOL, (symbol, limit))
+        else:
+            rows = self._iter_rows(_SQL_GET_TRADES, (limit,))
+        async for row in rows:
+            yield {
+                'symbol': row[0],
+                'action': row[1],
+                'amount': row[2],
+                'price': row[3],
+                'timestamp': row[4]
+            }
+
+    async def get_trade_history(self, symbol: str = None, limit: int = 10) -> list:
         """Retrieve trade history."""
-        db_path = os.path.join(self.data_dir, 'boulevard.db')
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            query = 'SELECT * FROM trades'
-            params = []
-            if symbol:
-                query += ' WHERE symbol = ?'
-                params.append(symbol)
-            query += ' ORDER BY timestamp DESC LIMIT ?'
-            params.append(limit)
-            
-            cursor.execute(query, params)
-            return [
-                {
-                    'symbol': row[1],
-                    'action': row[2],
-                    'amount': row[3],
-                    'price': row[4],
-                    'timestamp': row[5]
-                }
-                for row in cursor.fetchall()
-            ]
+        return [trade async for trade in self.iter_trade_history(symbol, limit)]
@@ -1,41 +1,312 @@
+import asyncio
+import codecs
+import hashlib
 import json
+import marshal
+import mmap
 import os
-from typing import Dict, Any, Optional
-import logging
+import re
+import shlex
 import shutil
-from pathlib import Path
-import subprocess
+import struct
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Characters that give a command meaning only a shell can provide (operators,
+# redirection, expansion, globbing); commands without them are exec'd directly
+_SHELL_SYNTAX = re.compile(r'[|&;<>()$`*?~\[\]{}!\\\n]')
+
+# Builtins that only exist inside a shell; commands starting with one, or with
+# a VAR=value assignment, are run through the shell too
+_SHELL_BUILTINS = frozenset(('cd', 'export', 'source', '.', 'set', 'unset', 'ulimit', 'umask'))
+
+# Where the {{variables}} are in a file's content: (start, end, name) per
+# placeholder, in order
+_Markers = Tuple[Tuple[int, int, bytes], ...]
+
+# A template file ready to write: (relative path, relative directory, content
+# bytes, markers, source path). The directory is '' for files at the project
+# root. Content is None for files copied verbatim from source, and a
+# memoryview into the mapped file when loaded from a shared cache.
+_PreparedFile = Tuple[str, str, Optional[bytes], _Markers, Optional[str]]
+
+# Shared cache file layout: header length, marshalled (mtime, template,
+# [(path, directory, offset, length, markers, source)]) header, then the
+# concatenated contents
+_CACHE_HEADER = struct.Struct('<Q')
+
+# A {{variable}} placeholder in template content
+_TEMPLATE_VAR = re.compile(rb'\{\{(\w+)\}\}')
+
+
+def _find_markers(content: bytes) -> _Markers:
+    return tuple((match.start(), match.end(), match.group(1)) for match in _TEMPLATE_VAR.finditer(content))
+
+async def _read_tail(stream: asyncio.StreamReader, cmd: str, max_lines: int) -> str:
+    """Read a subprocess stream to EOF as it is produced, keeping its last max_lines lines."""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    lines = deque(maxlen=max_lines)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    partial = ''
+    while True:
+        chunk = await stream.read(65536)
+        text = partial + decoder.decode(chunk, final=not chunk)
+        complete = text.splitlines(keepends=True)
+        partial = complete.pop() if complete and chunk and not complete[-1].endswith(('\n', '\r')) else ''
+        for line in complete:
+            lines.append(line)
+            if debug:
+                logger.debug("%s: %s", cmd, line.rstrip())
+        if not chunk:
+            return ''.join(lines)
+
+def _read_template_summary(template_path: str) -> Optional[Tuple[Any, Any]]:
+    """Return a template's (name, version), or None if it has no template.json.
+
+    Module-level so it can run in a worker process; only the two fields
+    cross the process boundary.
+    """
+    try:
+        with open(template_path, 'rb') as f:
+            template = _loads(f.read())
+    except FileNotFoundError:
+        return None
+    return template.get('name'), template.get('version')
 
 class TemplateManager:
     """Manages project templates and their application."""
     
-    def __init__(self, templates_dir: str = None):
+    # Parsed templates and their prepared files by path, with the mtime they
+    # were read at; shared by all instances and kept to the most recently used
+    # CACHE_SIZE entries
+    CACHE_SIZE = 128
+    _cache: Dict[str, Tuple[int, Dict[str, Any], List[_PreparedFile]]] = OrderedDict()
+    _cache_lock = threading.Lock()
+    # Rendered (path, bytes) file lists per framework and template variables
+    RENDERED_CACHE_SIZE = 32
+    # Template count from which list_templates parses in worker processes;
+    # below it, starting the pool costs more than the parsing
+    PARALLEL_PARSE_THRESHOLD = 64
+    # Lines of stdout and stderr kept from each install command
+    OUTPUT_TAIL_LINES = 1000
+    
+    def __init__(self, templates_dir: str = None, shared_cache_dir: Optional[str] = None):
         self.templates_dir = templates_dir or os.path.join(
             os.path.dirname(os.path.dirname(__file__)), 
             'templates'
         )
+        # Where prepared templates are saved for other processes to map
+        # instead of parsing template.json again; off when None
+        self.shared_cache_dir = shared_cache_dir
+        self._rendered: Dict[Tuple, Tuple[List[_PreparedFile], List[_PreparedFile]]] = OrderedDict()
+        self._rendered_lock = threading.Lock()
+        # (templates stamp, serialized list_templates response)
+        self._list_cache: Optional[Tuple[Tuple[int, ...], bytes]] = None
         logger.info(f"Template manager initialized with directory: {self.templates_dir}")
 
-    def get_template(self, framework: str) -> Optional[Dict[str, Any]]:
-        """Load a template configuration for the specified framework."""
+    @staticmethod
+    def _prepare_files(template: Dict[str, Any], template_dir: str) -> List[_PreparedFile]:
+        """Encode each template file's content, serializing JSON contents, and locate its placeholders.
+
+        A file given as {"source": path} instead of {"content": ...} is a
+        static asset in the template directory; it is copied verbatim rather
+        than loaded. Files are ordered deepest directory first, so creating
+        one file's directory also creates the parents later files need.
+        """
+        prepared = []
+        for file_path, file_config in template['files'].items():
+            directory = os.path.dirname(file_path)
+            if 'source' in file_config:
+                prepared.append((file_path, directory, None, (), os.path.join(template_dir, file_config['source'])))
+                continue
+            content = file_config['content']
+            content = _dumps_pretty(content) if isinstance(content, dict) else content.encode()
+            prepared.append((file_path, directory, content, _find_markers(content), None))
+        prepared.sort(key=lambda item: item[0].count('/'), reverse=True)
+        return prepared
+
+    def _shared_cache_path(self, template_path: str) -> str:
+        digest = hashlib.sha1(template_path.encode()).hexdigest()
+        return os.path.join(self.shared_cache_dir, f'{digest}-{marshal.version}.cache')
+
+    def _read_shared_cache(self, template_path: str, mtime: int) -> Optional[Tuple[Dict[str, Any], List[_PreparedFile]]]:
+        """Load a template's prepared files from the shared cache if it matches mtime.
+
+        File contents are views into a read-only mmap, so every process using
+        the cache shares the same physical pages.
+        """
+        try:
+            with open(self._shared_cache_path(template_path), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            header_size, = _CACHE_HEADER.unpack_from(mapped)
+            header_end = _CACHE_HEADER.size + header_size
+            cached_mtime, template, entries = marshal.loads(mapped[_CACHE_HEADER.size:header_end])
+            if cached_mtime != mtime:
+                return None
+            contents = memoryview(mapped)[header_end:]
+            prepared = [
+                (file_path, directory, contents[offset:offset + length] if source is None else None, markers, source)
+                for file_path, directory, offset, length, markers, source in entries
+            ]
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            return None
+        return template, prepared
+
+    def _write_shared_cache(self, template_path: str, mtime: int, template: Dict[str, Any],
+                            prepared: List[_PreparedFile]):
+        """Save prepared files to the shared cache, replacing it atomically."""
+        entries = []
+        offset = 0
+        for file_path, directory, content, markers, source in prepared:
+            length = len(content) if content is not None else 0
+            entries.append((file_path, directory, offset, length, markers, source))
+            offset += length
+        header = marshal.dumps((mtime, template, entries))
+        cache_path = self._shared_cache_path(template_path)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.shared_cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(_CACHE_HEADER.pack(len(header)))
+                f.write(header)
+                for _, _, content, _, _ in prepared:
+                    if content is not None:
+                        f.write(content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write shared template cache {cache_path}: {e}")
+
+    def _load_template(self, framework: str) -> Optional[Tuple[Dict[str, Any], List[_PreparedFile]]]:
+        """Load a template and its prepared files.
+
+        Both are cached and reused until template.json changes. Templates
+        whose files can't be prepared are rejected here rather than when
+        applied.
+        """
         template_path = os.path.join(self.templates_dir, framework, 'template.json')
         try:
-            with open(template_path, 'r') as f:
-                return json.load(f)
+            mtime = os.stat(template_path).st_mtime_ns
+            with self._cache_lock:
+                entry = self._cache.get(template_path)
+                if entry and entry[0] == mtime:
+                    self._cache.move_to_end(template_path)
+                    return entry[1], entry[2]
+            loaded = self._read_shared_cache(template_path, mtime) if self.shared_cache_dir else None
+            if loaded:
+                template, prepared = loaded
+            else:
+                with open(template_path, 'rb') as f:
+                    template = _loads(f.read())
+                prepared = self._prepare_files(template, os.path.dirname(template_path))
+                if self.shared_cache_dir:
+                    self._write_shared_cache(template_path, mtime, template, prepared)
+            with self._cache_lock:
+                self._cache[template_path] = (mtime, template, prepared)
+                self._cache.move_to_end(template_path)
+                if len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            return template, prepared
         except FileNotFoundError:
             logger.error(f"Template not found for framework: {framework}")
             return None
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing template for {framework}: {e}")
             return None
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Invalid template for {framework}: {e}")
+            return None
 
-    def apply_template(self, framework: str, project_path: str, project_name: str) -> Dict[str, Any]:
-        """Apply a template to create a new project."""
-        template = self.get_template(framework)
-        if not template:
+    def get_template(self, framework: str) -> Optional[Dict[str, Any]]:
+        """Load a template configuration for the specified framework."""
+        loaded = self._load_template(framework)
+        return loaded[0] if loaded else None
+
+    def _render_files(self, framework: str, prepared: List[_PreparedFile],
+                      variables: Dict[str, str]) -> List[_PreparedFile]:
+        """Return each template file's path and content with {{variables}} filled in.
+
+        Placeholders were located when the template was prepared, so each
+        file is assembled from the text between them and the variable values
+        without scanning it again; placeholders with no matching variable are
+        left as they are. The result is reused for the same framework and
+        variables until the template is reparsed.
+        """
+        key = (framework, tuple(sorted(variables.items())))
+        with self._rendered_lock:
+            entry = self._rendered.get(key)
+            if entry and entry[0] is prepared:
+                self._rendered.move_to_end(key)
+                return entry[1]
+
+        values = {name.encode(): value.encode() for name, value in variables.items()}
+
+        files = []
+        for file_path, directory, content, markers, source in prepared:
+            if markers:
+                parts = []
+                position = 0
+                for start, end, name in markers:
+                    parts.append(content[position:start])
+                    parts.append(values.get(name, content[start:end]))
+                    position = end
+                parts.append(content[position:])
+                content = b''.join(parts)
+            files.append((file_path, directory, content, (), source))
+
+        with self._rendered_lock:
+            self._rendered[key] = (prepared, files)
+            self._rendered.move_to_end(key)
+            if len(self._rendered) > self.RENDERED_CACHE_SIZE:
+                self._rendered.popitem(last=False)
+        return files
+
+    @staticmethod
+    def _write_file(path: str, content: bytes):
+        """Write content with raw os.write calls, skipping the buffered file object."""
+        # 0o666 under the umask gives the same permissions open() would
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    async def apply_template(self, framework: str, project_path: str, project_name: str,
+                             variables: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Apply a template to create a new project.
+
+        {{project_name}} and any other {{name}} placeholders given in
+        variables are filled in. Directories are created first; the files are
+        then written, or copied for static assets, concurrently on worker
+        threads. On success the loaded template is returned as well, so the
+        install and start steps don't have to look it up again.
+        """
+        loaded = self._load_template(framework)
+        if not loaded:
             return {
                 'status': 'error',
                 'message': f'Template not found for framework: {framework}'
@@ -44,32 +315,36 @@ class TemplateManager:
         try:
             # Create project directory if it doesn't exist
             os.makedirs(project_path, exist_ok=True)
+            # Relative directories that exist; template paths are relative, so
+            # plain concatenation onto the project path is enough
+            created_dirs = {''}
+            prefix = project_path + os.sep
 
             # Create files from template
-            for file_path, file_config in template['files'].items():
-                # Replace template variables
-                content = file_config['content']
-                if isinstance(content, str):
-                    content = content.replace('{{project_name}}', project_name)
-                elif isinstance(content, dict):
-                    content = json.dumps(content, indent=2).replace('{{project_name}}', project_name)
-                
-                # Create file
-                full_path = os.path.join(project_path, file_path)
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                
-                with open(full_path, 'w') as f:
-                    if isinstance(content, dict):
-                        json.dump(content, f, indent=2)
-                    else:
-                        f.write(content)
+            writes = []
+            variables = {**(variables or {}), 'project_name': project_name}
+            for file_path, directory, content, _, source in self._render_files(framework, loaded[1], variables):
+                full_path = prefix + file_path
+                if directory not in created_dirs:
+                    os.makedirs(prefix + directory, exist_ok=True)
+                    # makedirs created every parent too
+                    while directory not in created_dirs:
+                        created_dirs.add(directory)
+                        directory = os.path.dirname(directory)
+                if source is not None:
+                    # copyfile uses copy_file_range/sendfile where the OS has them
+                    writes.append(asyncio.to_thread(shutil.copyfile, source, full_path))
+                else:
+                    writes.append(asyncio.to_thread(self._write_file, full_path, content))
+            await asyncio.gather(*writes)
 
             logger.info(f"Applied {framework} template to {project_path}")
             return {
                 'status': 'success',
                 'message': f'Successfully created {framework} project: {project_name}',
                 'project_path': project_path,
-                'framework': framework
+                'framework': framework,
+                'template': loaded[0]
             }
 
         except Exception as e:
@@ -79,9 +354,89 @@ class TemplateManager:
                 'message': f'Failed to apply template: {str(e)}'
             }
 
-    async def run_install_commands(self, framework: str, project_path: str) -> Dict[str, Any]:
-        """Run installation commands for the project."""
-        template = self.get_template(framework)
+    def apply_template_sync(self, framework: str, project_path: str, project_name: str,
+                            variables: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Apply a template from synchronous code that isn't running an event loop."""
+        return asyncio.run(self.apply_template(framework, project_path, project_name, variables))
+
+    @staticmethod
+    def _group_install_commands(commands: List[Any]) -> List[List[str]]:
+        """Split install_commands into groups that run one after another.
+
+        An entry is either a command string, which runs on its own, or
+        {"cmd": ..., "parallel_group": n}; consecutive entries sharing a
+        parallel_group form one group whose commands run concurrently.
+        """
+        groups = []
+        last_group = None
+        for entry in commands:
+            if isinstance(entry, dict):
+                cmd, group = entry['cmd'], entry.get('parallel_group')
+            else:
+                cmd, group = entry, None
+            if group is not None and group == last_group:
+                groups[-1].append(cmd)
+            else:
+                groups.append([cmd])
+            last_group = group
+        return groups
+
+    @classmethod
+    async def _run_install_command(cls, cmd: str, project_path: str) -> Dict[str, Any]:
+        """Run one install command, without a shell unless it uses shell syntax.
+
+        Output is read as it arrives and only the last OUTPUT_TAIL_LINES lines
+        of each stream are kept, however verbose the command is.
+        """
+        try:
+            argv = None if _SHELL_SYNTAX.search(cmd) else shlex.split(cmd)
+            if not argv or '=' in argv[0] or argv[0] in _SHELL_BUILTINS:
+                process = await asyncio.create_subprocess_shell(
+                    cmd,
+                    cwd=project_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    cwd=project_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+        except (FileNotFoundError, PermissionError, ValueError) as e:
+            # A missing or non-executable program, or a command shlex can't
+            # split, fails the way exit status 127/126 did under the shell
+            return {'command': cmd, 'success': False, 'output': '', 'error': str(e)}
+        try:
+            stdout, stderr = await asyncio.gather(
+                _read_tail(process.stdout, cmd, cls.OUTPUT_TAIL_LINES),
+                _read_tail(process.stderr, cmd, cls.OUTPUT_TAIL_LINES)
+            )
+            await process.wait()
+        except BaseException:
+            # Don't leave the child running unsupervised
+            if process.returncode is None:
+                process.kill()
+            raise
+
+        return {
+            'command': cmd,
+            'success': process.returncode == 0,
+            'output': stdout,
+            'error': stderr
+        }
+
+    async def run_install_commands(self, framework: str, project_path: str,
+                                   template: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run installation commands for the project.
+
+        Commands run in order, except that commands the template puts in the
+        same parallel_group run concurrently. Pass template when the caller
+        already has it loaded to skip the lookup.
+        """
+        if template is None:
+            template = self.get_template(framework)
         if not template:
             return {
                 'status': 'error',
@@ -90,27 +445,25 @@ class TemplateManager:
 
         try:
             results = []
-            for cmd in template.get('install_commands', []):
-                process = await asyncio.create_subprocess_shell(
-                    cmd,
-                    cwd=project_path,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
+            for group in self._group_install_commands(template.get('install_commands', [])):
+                # Wait for every command in the group even if one raises, so
+                # none is left running with nobody reading its output
+                outcomes = await asyncio.gather(
+                    *(self._run_install_command(cmd, project_path) for cmd in group),
+                    return_exceptions=True
                 )
-                stdout, stderr = await process.communicate()
-                
-                result = {
-                    'command': cmd,
-                    'success': process.returncode == 0,
-                    'output': stdout.decode() if stdout else '',
-                    'error': stderr.decode() if stderr else ''
-                }
-                results.append(result)
+                group_results = [
+                    {'command': cmd, 'success': False, 'output': '', 'error': str(outcome)}
+                    if isinstance(outcome, BaseException) else outcome
+                    for cmd, outcome in zip(group, outcomes)
+                ]
+                results.extend(group_results)
                 
-                if not result['success']:
+                failed = next((result for result in group_results if not result['success']), None)
+                if failed:
                     return {
                         'status': 'error',
-                        'message': f'Installation command failed: {cmd}',
+                        'message': f"Installation command failed: {failed['command']}",
                         'results': results
                     }
 
@@ -127,9 +480,11 @@ class TemplateManager:
                 'message': f'Failed to run install commands: {str(e)}'
             }
 
-    def get_start_command(self, framework: str) -> Optional[str]:
+    def get_start_command(self, framework: str,
+                          template: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """Get the command to start the project."""
-        template = self.get_template(framework)
+        if template is None:
+            template = self.get_template(framework)
         if template and template.get('start_commands'):
             return template['start_commands'][0]
         return None
@@ -137,17 +492,30 @@ class TemplateManager:
     def list_templates(self) -> Dict[str, Any]:
         """List all available templates."""
         try:
-            templates = []
-            for framework in os.listdir(self.templates_dir):
-                template_path = os.path.join(self.templates_dir, framework, 'template.json')
-                if os.path.exists(template_path):
-                    with open(template_path, 'r') as f:
-                        template = json.load(f)
-                        templates.append({
-                            'framework': framework,
-                            'name': template.get('name'),
-                            'version': template.get('version')
-                        })
+            frameworks = []
+            paths = []
+            with os.scandir(self.templates_dir) as entries:
+                for entry in entries:
+                    # d_type from the directory listing answers this without a stat
+                    if entry.is_dir():
+                        frameworks.append(entry.name)
+                        paths.append(os.path.join(entry.path, 'template.json'))
+
+            if len(paths) >= self.PARALLEL_PARSE_THRESHOLD:
+                with ProcessPoolExecutor() as executor:
+                    summaries = list(executor.map(_read_template_summary, paths, chunksize=16))
+            else:
+                summaries = [_read_template_summary(path) for path in paths]
+
+            templates = [
+                {
+                    'framework': framework,
+                    'name': summary[0],
+                    'version': summary[1]
+                }
+                for framework, summary in zip(frameworks, summaries)
+                if summary is not None
+            ]
             
             return {
                 'status': 'success',
@@ -159,3 +527,33 @@ class TemplateManager:
                 'status': 'error',
                 'message': f'Failed to list templates: {str(e)}'
             }
+
+    def _templates_stamp(self) -> Tuple[int, ...]:
+        """mtimes of the templates directory and of each template.json in it."""
+        stamp = [os.stat(self.templates_dir).st_mtime_ns]
+        with os.scandir(self.templates_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    try:
+                        stamp.append(os.stat(os.path.join(entry.path, 'template.json')).st_mtime_ns)
+                    except FileNotFoundError:
+                        stamp.append(0)
+        return tuple(stamp)
+
+    def list_templates_bytes(self) -> bytes:
+        """The list_templates response serialized to JSON, ready to send.
+
+        The bytes are reused until a template is added, removed or edited.
+        """
+        try:
+            stamp = self._templates_stamp()
+        except OSError:
+            return _dumps(self.list_templates())
+        cached = self._list_cache
+        if cached and cached[0] == stamp:
+            return cached[1]
+        response = self.list_templates()
+        body = _dumps(response)
+        if response['status'] == 'success':
+            self._list_cache = (stamp, body)
+        return body